@@ -16,9 +16,13 @@ Usage:
 python auto_generate_ppt_openpyxl.py  --xlsx sample_sales_mix.xlsx  --sheet Sheet1  --summary_start A12  --key_header Product  --out deck.pptx  --link_mode overlay  --table_font_pt 12  --round_digits 2  --skip_cols 2 4  --verbose
 """
 import argparse
+import copy
+import functools
 import re
 from pathlib import Path
+from xml.sax.saxutils import escape
 
+import numpy as np
 import pandas as pd
 from openpyxl import load_workbook
 from openpyxl.utils.cell import coordinate_to_tuple, get_column_letter, range_boundaries
@@ -27,11 +31,54 @@ from pptx.util import Inches, Pt
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.text import MSO_AUTO_SIZE
 from pptx.dml.color import RGBColor
+from pptx.oxml import parse_xml
 from pptx.oxml.xmlchemy import OxmlElement
 from pptx.oxml.ns import qn
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 
 # ---------------- Excel helpers ----------------
+
+# Table references look like ``Table1[...`` -- compiled once at import rather
+# than on every formula we inspect.
+_TABLE_REF_RE = re.compile(r"([A-Za-z0-9_]+)\[")
+
+# Bracketed tokens of a structured reference, e.g. ``[Column]`` or ``[#This Row]``.
+_STRUCT_TOKEN_RE = re.compile(r"\[([^\]]+)\]")
+
+# openpyxl's get_column_letter recomputes the letters on every call; the
+# handful of columns we touch repeat constantly, so cache the mapping.
+_col_letter = functools.lru_cache(maxsize=128)(get_column_letter)
+
+
+@functools.lru_cache(maxsize=512)
+def _strip_spaces(formula):
+    """Space-stripped form of a formula, cached per unique formula string.
+
+    Excel Tables propagate the same formula down every row, so the hot loops
+    see each distinct formula many times.
+    """
+    return formula.replace(" ", "")
+
+
+@functools.lru_cache(maxsize=256)
+def _row_patterns(row_idx, key_col_idx, table_name):
+    """Compiled criteria patterns for one (table, key-cell) combination.
+
+    Returns ``(pat_eq, pat_func, pat_func_rev)``.  All metrics in a summary
+    row share the same key cell, so caching collapses the column-letter
+    lookup and the three ``re.compile`` calls per cell into one per row.
+    """
+    col_letter = _col_letter(key_col_idx)
+    cell_pat = rf"\$?{col_letter}\$?{row_idx}"
+    tbl = re.escape(table_name)
+    pat_eq = re.compile(
+        rf"(?:{tbl}\[([^\]]+?)\]={cell_pat}|{cell_pat}={tbl}\[([^\]]+?)\])"
+    )
+    pat_func = re.compile(rf"{tbl}\[([^\]]+?)\],{cell_pat}")
+    pat_func_rev = re.compile(rf"{cell_pat},{tbl}\[([^\]]+?)\]")
+    return pat_eq, pat_func, pat_func_rev
+
+
 def get_formula_str(cell):
     val = cell.value
     # openpyxl marks formulas with data_type "f" but the stored value may be
@@ -48,13 +95,29 @@ def get_formula_str(cell):
         return val
     return None
 
-def detect_summary_region_from_start(ws, start_addr, max_cols=60, verbose=False):
+def _sheet_grid(ws):
+    """Materialize a worksheet's values as a list of row tuples.
+
+    Read-only worksheets stream their XML, so random ``ws.cell`` access is
+    O(row); snapshotting once via ``iter_rows`` keeps later lookups O(1).
+    """
+    return list(ws.iter_rows(values_only=True))
+
+def _grid_value(grid, row, col):
+    """1-based cell lookup into a ``_sheet_grid`` snapshot (None if outside)."""
+    if 1 <= row <= len(grid):
+        row_vals = grid[row - 1]
+        if 1 <= col <= len(row_vals):
+            return row_vals[col - 1]
+    return None
+
+def detect_summary_region_from_start(grid, start_addr, max_cols=60, verbose=False):
     start_row, start_col = coordinate_to_tuple(start_addr)
     hdr_row = start_row - 1
 
     headers, c = [], start_col
     while True:
-        val = ws.cell(row=hdr_row, column=c).value
+        val = _grid_value(grid, hdr_row, c)
         if val in (None, ""):
             break
         headers.append(str(val))
@@ -64,7 +127,7 @@ def detect_summary_region_from_start(ws, start_addr, max_cols=60, verbose=False)
 
     data_rows, r = [], start_row
     while True:
-        v = ws.cell(row=r, column=start_col).value
+        v = _grid_value(grid, r, start_col)
         if v in (None, ""):
             break
         data_rows.append(r)
@@ -74,6 +137,7 @@ def detect_summary_region_from_start(ws, start_addr, max_cols=60, verbose=False)
         print(f"[summary] header row={hdr_row}, headers={headers}, data_rows={data_rows}")
     return hdr_row, headers, data_rows, start_col
 
+@functools.lru_cache(maxsize=1024)
 def parse_structured_columns(formula, table_name):
     """Return a list of column names referenced via structured references.
 
@@ -84,58 +148,54 @@ def parse_structured_columns(formula, table_name):
     if not formula:
         return []
 
-    tokens = re.findall(r"\[([^\]]+)\]", formula.replace("'", ""))
     cols: list[str] = []
-    for tok in tokens:
+    seen: set[str] = set()
+    for tok in _STRUCT_TOKEN_RE.findall(formula.replace("'", "")):
         tok = tok.lstrip("[")
-        if tok.startswith("#"):
+        if tok.startswith("#") or tok in seen:
             continue
-        if tok not in cols:
-            cols.append(tok)
+        seen.add(tok)
+        cols.append(tok)
     return cols
 
-def extract_table_names(formula):
+@functools.lru_cache(maxsize=1024)
+def extract_table_names(formula, formula_canon=None):
     if not formula:
         return []
-    s = formula.replace("'", "")
-    names = re.findall(r"([A-Za-z0-9_]+)\[", s)
-    seen = []
-    for n in names:
-        if n not in seen:
-            seen.append(n)
-    return seen
-
-def extract_filter_key(formula, table_name, sht, row_idx, key_col_idx):
+    # No quote-stripping needed: the identifier character class cannot match
+    # across a quote anyway.
+    s = formula_canon if formula_canon is not None else formula
+    return list(dict.fromkeys(_TABLE_REF_RE.findall(s)))
+
+def extract_filter_key(formula, table_name, grid, row_idx, key_col_idx, formula_canon=None):
     if not formula:
         return (None, None)
-    s = formula.replace(" ", "")
-    col_letter = get_column_letter(key_col_idx)
-    cell_pat = rf"\$?{col_letter}\$?{row_idx}"
+    s = formula_canon if formula_canon is not None else _strip_spaces(formula)
+    # every pattern below requires a table_name[ reference, so a substring
+    # miss lets us skip all three searches
+    if table_name not in s:
+        return (None, None)
+    pat_eq, pat_func, pat_func_rev = _row_patterns(row_idx, key_col_idx, table_name)
     # Equality comparison (e.g., Table1[Product]=$A12)
-    pat_eq = re.compile(
-        rf"(?:{re.escape(table_name)}\[([^\]]+?)\]={cell_pat}|{cell_pat}={re.escape(table_name)}\[([^\]]+?)\])"
-    )
     m = pat_eq.search(s)
     if m:
         col = (m.group(1) or m.group(2) or "").replace("'", "")
-        key_value = sht.cell(row=row_idx, column=key_col_idx).value
+        key_value = _grid_value(grid, row_idx, key_col_idx)
         return (col, key_value)
     # Function-style criteria (e.g., SUMIFS(Table1[Amount],Table1[Product],$A12))
-    pat_func = re.compile(rf"{re.escape(table_name)}\[([^\]]+?)\],{cell_pat}")
     m = pat_func.search(s)
     if m:
         col = m.group(1).replace("'", "")
-        key_value = sht.cell(row=row_idx, column=key_col_idx).value
+        key_value = _grid_value(grid, row_idx, key_col_idx)
         return (col, key_value)
-    pat_func_rev = re.compile(rf"{cell_pat},{re.escape(table_name)}\[([^\]]+?)\]")
     m = pat_func_rev.search(s)
     if m:
         col = m.group(1).replace("'", "")
-        key_value = sht.cell(row=row_idx, column=key_col_idx).value
+        key_value = _grid_value(grid, row_idx, key_col_idx)
         return (col, key_value)
     return (None, None)
 def read_all_tables(wb_formula, wb_values, verbose: bool = False):
-    """Return DataFrames and column formulas for all Excel Tables."""
+    """Return value DataFrames and per-column formula lists for all Excel Tables."""
     tables = {}
     table_formulas = {}
     for ws_formula in wb_formula.worksheets:
@@ -149,39 +209,56 @@ def read_all_tables(wb_formula, wb_values, verbose: bool = False):
         for name, tbl in table_iter:
             ref = getattr(tbl, "ref", tbl)
             min_col, min_row, max_col, max_row = range_boundaries(ref)
-            headers = [ws_values.cell(row=min_row, column=c).value for c in range(min_col, max_col + 1)]
-            data = []
+            value_rows = list(ws_values.iter_rows(
+                min_row=min_row, max_row=max_row,
+                min_col=min_col, max_col=max_col,
+                values_only=True,
+            ))
+            headers = list(value_rows[0])
+            data = [list(rv) for rv in value_rows[1:]]
             formula_rows = []
             for r in range(min_row + 1, max_row + 1):
-                row_vals = []
-                row_fml = []
-                for c in range(min_col, max_col + 1):
-                    row_vals.append(ws_values.cell(row=r, column=c).value)
-                    row_fml.append(get_formula_str(ws_formula.cell(row=r, column=c)))
-                data.append(row_vals)
-                formula_rows.append(row_fml)
+                formula_rows.append([
+                    get_formula_str(ws_formula.cell(row=r, column=c))
+                    for c in range(min_col, max_col + 1)
+                ])
             df = pd.DataFrame(data, columns=headers)
-            df_fml = pd.DataFrame(formula_rows, columns=headers)
+            # Formulas are only ever read back per column name, so a plain
+            # dict of lists avoids the DataFrame/BlockManager construction.
+            df_fml = {h: [row[j] for row in formula_rows] for j, h in enumerate(headers)}
             tables[name] = df
             table_formulas[name] = df_fml
             if verbose:
                 for j, h in enumerate(headers):
-                    formula = df_fml.iloc[0, j]
+                    formula = df_fml[h][0]
                     parsed = parse_structured_columns(formula, name) if formula else []
                     print(f"[table] {name} column={h} formula={formula} parsed={parsed}")
     if not tables:
         raise RuntimeError("No Excel Table (ListObject) found in this workbook.")
     return tables, table_formulas
 
-def guess_key_col(df_raw, preferred_name):
-    import re as _re
+_NONWORD_RE = re.compile(r"\W+")
+_KEY_TARGET_NORMS = frozenset({'subsystem', 'subsystemname', 'sub_system', 'sub system'})
+
+@functools.lru_cache(maxsize=256)
+def _norm_col_name(name):
+    """Lower-cased column name with runs of non-word chars collapsed to spaces."""
+    return _NONWORD_RE.sub(' ', name).strip().lower()
+
+def guess_key_col(df_raw, preferred_name, norm_map=None):
+    """Pick the key column, preferring ``preferred_name`` then subsystem-ish names.
+
+    ``norm_map`` maps column name -> normalized name; callers in hot loops
+    pass a precomputed map so the normalization runs once per table rather
+    than once per (row, metric).
+    """
     if preferred_name in df_raw.columns:
         return preferred_name
-    target_norms = {'subsystem','subsystemname','sub_system', 'sub system'}
+    if norm_map is None:
+        norm_map = {nm: _norm_col_name(str(nm)) for nm in df_raw.columns}
     best = None
-    for nm in df_raw.columns:
-        norm = _re.sub(r'\\W+', ' ', str(nm)).strip().lower()
-        if norm in target_norms:
+    for nm, norm in norm_map.items():
+        if norm in _KEY_TARGET_NORMS:
             return nm
         if 'sub' in norm and 'system' in norm:
             best = nm
@@ -189,26 +266,24 @@ def guess_key_col(df_raw, preferred_name):
 
 # ---------------- PPT helpers ----------------
 
+# built once; callers append a deepcopy instead of re-constructing
+_ALPHA_ZERO_TEMPLATE = OxmlElement('a:alpha')
+_ALPHA_ZERO_TEMPLATE.set('val', '0')  # 0 = 0% opacity
+
 def _force_xml_alpha_zero(shape):
     """
     Force 100% transparency by injecting a:alpha val="0" into the solid fill color node.
     Works with python-pptx's BaseOxmlElement.xpath (no namespaces kwarg).
     """
     el = shape._element
-    srgb = el.xpath('.//a:solidFill/a:srgbClr')
-    if srgb:
-        clr = srgb[0]
-    else:
-        scheme = el.xpath('.//a:solidFill/a:schemeClr')
-        if not scheme:
-            return
-        clr = scheme[0]
+    clrs = el.xpath('.//a:solidFill/a:srgbClr | .//a:solidFill/a:schemeClr')
+    if not clrs:
+        return
+    clr = clrs[0]
     # remove any existing alpha child
     for a in clr.xpath('./a:alpha'):
         clr.remove(a)
-    alpha = OxmlElement('a:alpha')
-    alpha.set('val', '0')  # 0 = 0% opacity
-    clr.append(alpha)
+    clr.append(copy.deepcopy(_ALPHA_ZERO_TEMPLATE))
 def add_overlay_link(summary_slide, x, y, w, h, target_slide):
     rect = summary_slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, x, y, w, h)
     # Make invisible
@@ -261,6 +336,52 @@ def link_run_to_slide(run, dest_slide, tooltip_text: str = ""):
         h.set("tooltip", tooltip_text)
     rPr.append(h)
 
+def _fast_set_cell_text(cell, text, size_hundredths, bold=False, wrap=None):
+    """Write a table cell's text as one prebuilt ``<a:txBody>`` subtree.
+
+    The python-pptx route (``tf.clear(); add_run(); run.font.size = ...``)
+    walks the XML tree for every property setter; replacing the whole
+    ``txBody`` in a single lxml assignment is much cheaper across large
+    tables.  ``size_hundredths`` is the font size in hundredths of a point;
+    ``wrap=False`` matches ``text_frame.word_wrap = False``.
+    """
+    tc = cell._tc
+    wrap_attr = ' wrap="none"' if wrap is False else ''
+    bold_attr = ' b="1"' if bold else ''
+    txBody = parse_xml(
+        '<a:txBody xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+        f'<a:bodyPr{wrap_attr}/><a:lstStyle/>'
+        f'<a:p><a:r><a:rPr lang="en-US" sz="{size_hundredths}"{bold_attr}/>'
+        f'<a:t>{escape(text)}</a:t></a:r></a:p></a:txBody>'
+    )
+    old = tc.find(qn('a:txBody'))
+    if old is not None:
+        tc.replace(old, txBody)
+    else:
+        tc.insert(0, txBody)
+
+def _save_pptx(prs, out_path):
+    """Save ``prs`` using fast (level-1) deflate compression.
+
+    python-pptx's zip writer uses zlib's default level 6; level 1 deflates
+    roughly 3-5x faster for ~10% larger files, and final serialization is
+    the dominant cost on decks with many slides.  The stdlib ``ZipFile`` is
+    swapped for a level-1 partial only for the duration of the save; if the
+    writer module ever moves we just fall back to a plain save.
+    """
+    try:
+        import zipfile
+        from pptx.opc import serialized  # noqa: F401 -- ensures writer uses zipfile
+    except ImportError:
+        prs.save(out_path)
+        return
+    orig_zipfile = zipfile.ZipFile
+    zipfile.ZipFile = functools.partial(orig_zipfile, compresslevel=1)
+    try:
+        prs.save(out_path)
+    finally:
+        zipfile.ZipFile = orig_zipfile
+
 # ---------------- Formatting helper ----------------
 def format_number(val, round_digits: int) -> str:
     if val is None:
@@ -290,8 +411,10 @@ def build_ppt_openpyxl(
     slide_layout_idx: int = 5,
     allow_zero: bool = False,
 ):
-    wb_formula = load_workbook(xlsx_path, data_only=False)
-    wb_values = load_workbook(xlsx_path, data_only=True)
+    # Table definitions are unavailable on read-only worksheets, so the
+    # formula workbook stays in normal mode; the values workbook streams.
+    wb_formula = load_workbook(xlsx_path, data_only=False, keep_links=False)
+    wb_values = load_workbook(xlsx_path, read_only=True, data_only=True, keep_links=False)
     try:
         ws_formula = wb_formula[sheet_name] if sheet_name else wb_formula.active
         ws_values = wb_values[sheet_name] if sheet_name else wb_values.active
@@ -302,36 +425,89 @@ def build_ppt_openpyxl(
         else:
             default_table_name = next(iter(table_dfs))
 
-        hdr_row, headers, data_rows, start_col_idx = detect_summary_region_from_start(ws_values, summary_start, verbose=verbose)
+        values_grid = _sheet_grid(ws_values)
+        hdr_row, headers, data_rows, start_col_idx = detect_summary_region_from_start(values_grid, summary_start, verbose=verbose)
         if not headers or not data_rows:
             raise RuntimeError("Could not detect headers or data rows; check --summary_start.")
 
         if key_header is None:
             key_header = str(headers[0])
 
+        # round_digits is fixed for the run, so bind the format spec once
+        # instead of rebuilding it inside format_number for every cell.
+        num_fmt = f"{{:.{round_digits}f}}".format
+        zero_fmt = "{:.0f}".format
+        # keys and categorical snippet values repeat across the deck, so the
+        # formatted strings are worth memoizing; the cache is keyed by
+        # (type, value) because equal values of different types hash alike
+        # but format differently (True vs 1, np.int64(4) vs 4)
+        fmt_cache: dict = {}
+
+        def fmt(val):
+            if val is None:
+                return ""
+            t = type(val)
+            if t is bool:
+                return str(val)
+            try:
+                return fmt_cache[(t, val)]
+            except KeyError:
+                pass
+            except TypeError:  # unhashable value; format without caching
+                if isinstance(val, (int, float)):
+                    return zero_fmt(val) if val == 0 else num_fmt(val)
+                return str(val)
+            if t is int or t is float or isinstance(val, (int, float)):
+                text = zero_fmt(val) if val == 0 else num_fmt(val)
+            else:
+                text = str(val)
+            fmt_cache[(t, val)] = text
+            return text
+
+        # EMU/Pt constants reused on every detail slide; Inches()/Pt() are
+        # object constructions we don't need to repeat per iteration.
+        _I02 = Inches(0.2)
+        _I05 = Inches(0.5)
+        _I12 = Inches(1.2)
+        _PT14 = Pt(14)
+        _PTF = Pt(table_font_pt)
+        _SNIP_ROW_H = Inches(0.4 * table_font_pt / 18)
+
         # collect formulas/values
         last_row_in_block = data_rows[-1]
+        block_top = data_rows[0]
+        # One bulk read of the summary block's formulas; everything after is
+        # plain list indexing, including the neighbor-row fallback scan.
+        formula_block = [
+            [get_formula_str(cell) for cell in row_cells]
+            for row_cells in ws_formula.iter_rows(
+                min_row=block_top, max_row=last_row_in_block,
+                min_col=start_col_idx, max_col=start_col_idx + len(headers) - 1,
+            )
+        ]
+        # Propagate the nearest formula within each metric column up front
+        # (nearest above, else nearest below -- the same semantics as the old
+        # per-cell up/down probe loop) in one vectorized pass.
+        if formula_block:
+            fml_df = pd.DataFrame(formula_block).ffill().bfill()
+            formula_block = fml_df.where(fml_df.notna(), None).to_numpy().tolist()
+
         summary = []
         for r in data_rows:
-            key_value = ws_values.cell(row=r, column=start_col_idx).value
+            key_value = _grid_value(values_grid, r, start_col_idx)
             items = {"row": r, "key": key_value, "cells": {}}
             for c_off, h in enumerate(headers[1:], start=1):
                 c_idx = start_col_idx + c_off
-                cell_formula = ws_formula.cell(row=r, column=c_idx)
-                f = get_formula_str(cell_formula)
-                if not f:
-                    rr = r - 1
-                    while rr >= hdr_row + 1 and not f:
-                        f = get_formula_str(ws_formula.cell(row=rr, column=c_idx)); rr -= 1
-                    if not f:
-                        rr = r + 1
-                        while rr <= last_row_in_block and not f:
-                            f = get_formula_str(ws_formula.cell(row=rr, column=c_idx)); rr += 1
-                tbls = extract_table_names(f)
-                val = ws_values.cell(row=r, column=c_idx).value
+                f = formula_block[r - block_top][c_off]
+                # Canonicalize once; every later parse of this cell's formula
+                # reuses the stripped form instead of re-running replace().
+                canon = f.replace(" ", "").replace("'", "") if f else ""
+                tbls = extract_table_names(f, canon)
+                val = _grid_value(values_grid, r, c_idx)
                 items["cells"][h] = {
-                    "address": cell_formula.coordinate,
+                    "address": f"{_col_letter(c_idx)}{r}",
                     "formula": f,
+                    "formula_canon": canon,
                     "value": val,
                     "table": tbls[0] if tbls else None,
                 }
@@ -342,7 +518,8 @@ def build_ppt_openpyxl(
         prs = Presentation(pptx_in_path) if pptx_in_path else Presentation()
         skip_set = set(skip_col_idxs or [])
         # Title Only layout
-        summary_slide = prs.slides.add_slide(prs.slide_layouts[slide_layout_idx])
+        slide_layout = prs.slide_layouts[slide_layout_idx]
+        summary_slide = prs.slides.add_slide(slide_layout)
         summary_slide.shapes.title.text = "Summary Table"
 
         # table scaffold aligned with title margins
@@ -367,21 +544,69 @@ def build_ppt_openpyxl(
         col_widths[-1] = base_w + remainder
         for j in range(sum_cols):
             table.columns[j].width = col_widths[j]
-        for i in range(sum_rows):
-            table.rows[i].height = int(base_row_height)
+        # same height everywhere: set the a:tr attributes directly rather
+        # than constructing a row proxy per row
+        row_h = str(int(base_row_height))
+        for tr in table._tbl.iter(qn('a:tr')):
+            tr.set('h', row_h)
 
         # header text (no wrap)
+        sz_hundredths = table_font_pt * 100
         for j, h in enumerate(headers):
-            tf = table.cell(0, j).text_frame
-            tf.clear()
-            tf.word_wrap = False
-            run = tf.paragraphs[0].add_run()
-            run.text = str(h)
-            run.font.bold = True
-            run.font.size = Pt(table_font_pt)
+            _fast_set_cell_text(table.cell(0, j), str(h), sz_hundredths, bold=True, wrap=False)
 
         # build detail slides first
-        detail_slide_map = {}
+        # Row positions per key, computed once per (table, column) instead of
+        # re-scanning the raw table with a boolean mask for every cell.
+        group_cache: dict[tuple[str, str], dict] = {}
+        # column-narrowed views of each raw table, shared by all detail
+        # slides that use the same (table, columns) combination
+        narrow_cache: dict[tuple[str, tuple], pd.DataFrame] = {}
+
+        def group_indices(tbl, df, col):
+            cache_key = (tbl, col)
+            if cache_key not in group_cache:
+                group_cache[cache_key] = df.groupby(col, sort=False).indices
+            return group_cache[cache_key]
+
+        # The filter column is a property of the metric's formula shape, not
+        # of the individual row (Excel Tables propagate the same structure
+        # down the column), so parse it once per metric from the first row
+        # that has a formula rather than re-running the regexes per row.
+        per_metric_filter_col = {}
+        for metric in headers[1:]:
+            per_metric_filter_col[metric] = None
+            for row0 in summary:
+                info0 = row0["cells"][metric]
+                if not info0["formula"]:
+                    continue
+                col0, _ = extract_filter_key(
+                    info0["formula"], info0.get("table") or default_table_name,
+                    values_grid, row0["row"],
+                    key_col_idx=start_col_idx, formula_canon=info0["formula_canon"],
+                )
+                # a back-filled formula references another row's key cell and
+                # will not match against this row; keep scanning until a row's
+                # own formula parses before giving up to guess_key_col
+                if col0 is not None:
+                    per_metric_filter_col[metric] = col0
+                    break
+
+        # O(1) column-membership tests instead of pd.Index.__contains__ scans
+        table_col_sets = {name: frozenset(df.columns) for name, df in table_dfs.items()}
+        # normalized column names, computed once per table for guess_key_col
+        table_norm_cols = {
+            name: {col: _norm_col_name(str(col)) for col in df.columns}
+            for name, df in table_dfs.items()
+        }
+
+        # Collect everything each detail slide needs as plain picklable data
+        # first, then render the batch against the shared Presentation.
+        # (Rendering in worker processes was considered but rejected: slide
+        # parts hold relationships -- layout, summary-slide hyperlinks --
+        # whose ids only the main Presentation can allocate, and the compute
+        # phase is already cheap after the caching above.)
+        detail_specs = []
         for i, row in enumerate(summary, start=1):
             key = row["key"]
             for j, metric in enumerate(headers[1:], start=1):
@@ -394,6 +619,7 @@ def build_ppt_openpyxl(
                 formula = info["formula"]
                 tbl_name = info.get("table") or default_table_name
                 df_raw = table_dfs.get(tbl_name, table_dfs[default_table_name])
+                col_set = table_col_sets[tbl_name if tbl_name in table_col_sets else default_table_name]
                 cols_used = [key_header] + parse_structured_columns(formula, tbl_name)
                 # Include columns referenced by formulas of previously found columns
                 seen = list(dict.fromkeys(cols_used))
@@ -401,129 +627,179 @@ def build_ppt_openpyxl(
                 while idx < len(seen):
                     col = seen[idx]
                     tf_df = table_formulas.get(tbl_name)
-                    if tf_df is not None and col in tf_df.columns:
+                    if tf_df is not None and col in tf_df:
                         col_formula = next((f for f in tf_df[col] if f), None)
                         refs = parse_structured_columns(col_formula, tbl_name)
                         for r in refs:
                             if r not in seen:
                                 seen.append(r)
                     idx += 1
-                cols_used = [c for c in seen if c in df_raw.columns]
+                cols_used = [c for c in seen if c in col_set]
                 if not cols_used:
-                    cols_used = [key_header] if key_header in df_raw.columns else list(df_raw.columns)
-                colname, key_from_formula = extract_filter_key(formula, tbl_name, ws_values, row["row"], key_col_idx=start_col_idx)
+                    cols_used = [key_header] if key_header in col_set else list(df_raw.columns)
+                norm_map = table_norm_cols.get(tbl_name, table_norm_cols[default_table_name])
+                colname = per_metric_filter_col.get(metric)
                 if colname is None:
-                    colname = guess_key_col(df_raw, key_header)
-                key_val = key_from_formula if key_from_formula is not None else key
+                    colname = guess_key_col(df_raw, key_header, norm_map)
+                key_val = key
                 try:
-                    df_filtered = df_raw[df_raw[colname] == key_val]
+                    idx = group_indices(tbl_name, df_raw, colname).get(key_val)
                 except Exception:
-                    key_col = guess_key_col(df_raw, key_header)
-                    df_filtered = df_raw[df_raw[key_col] == key_val]
-                df_snippet = df_filtered[cols_used].copy()
-
-                slide = prs.slides.add_slide(prs.slide_layouts[slide_layout_idx])
-                slide.shapes.title.text = f"{key} – {metric}"
-                title_shape = slide.shapes.title
-                right_margin = prs.slide_width - (title_shape.left + title_shape.width)
-                content_left = title_shape.left
-                content_width = prs.slide_width - content_left - right_margin
-                # Home button to return to summary
-                btn_left = prs.slide_width - right_margin - Inches(0.5)
+                    key_col = guess_key_col(df_raw, key_header, norm_map)
+                    idx = group_indices(tbl_name, df_raw, key_col).get(key_val)
+                if idx is None:
+                    idx = np.empty(0, dtype=np.int64)
+                # narrow to the needed columns first (cached per signature),
+                # then pick rows, so iloc never materializes full-width rows;
+                # the snippet is only ever read from, so no copy is taken
+                sub_key = (tbl_name, tuple(cols_used))
+                df_narrow = narrow_cache.get(sub_key)
+                if df_narrow is None:
+                    df_narrow = df_raw[cols_used]
+                    narrow_cache[sub_key] = df_narrow
+                df_snippet = df_narrow.iloc[idx]
+                snippet_cols = list(cols_used)
+                # one array per column rather than a single mixed-dtype
+                # matrix: to_numpy() on the whole frame coerces int64 cells
+                # to Python int, which format_number renders with forced
+                # decimals ("4.00") where the deck always showed "4".
+                # Series.array (not to_numpy) so iteration boxes each cell
+                # exactly as iloc did — np.int64 for ints, Timestamp rather
+                # than raw np.datetime64 for datetime columns
+                snippet_values = [df_snippet[h].array for h in snippet_cols]
+                detail_specs.append({
+                    "pos": (i, metric),
+                    "title": f"{key} – {metric}",
+                    "formula": formula,
+                    "value_text": fmt(val),
+                    "snippet_cols": snippet_cols,
+                    "snippet_values": snippet_values,
+                })
+
+        detail_slide_map = {}
+        home_btn_tmpl = None
+        for spec in detail_specs:
+            snippet_cols = spec["snippet_cols"]
+            snippet_values = spec["snippet_values"]
+            formula = spec["formula"]
+            slide = prs.slides.add_slide(slide_layout)
+            slide.shapes.title.text = spec["title"]
+            title_shape = slide.shapes.title
+            right_margin = prs.slide_width - (title_shape.left + title_shape.width)
+            content_left = title_shape.left
+            content_width = prs.slide_width - content_left - right_margin
+            # Home button to return to summary: built in full once, then
+            # cloned with just the position, shape id and link rId rewritten
+            btn_left = prs.slide_width - right_margin - _I05
+            if home_btn_tmpl is None:
                 btn = slide.shapes.add_shape(
                     MSO_SHAPE.ACTION_BUTTON_HOME,
                     btn_left,
-                    Inches(0.2),
-                    Inches(0.5),
-                    Inches(0.5),
+                    _I02,
+                    _I05,
+                    _I05,
                 )
                 btn.click_action.target_slide = summary_slide
                 btn.text_frame.text = ""
-                # Formula box
-                formula_height = Inches(1.2)
-                formula_top = title_shape.top + title_shape.height + Inches(0.2)
-                tx = slide.shapes.add_textbox(content_left, formula_top, content_width, formula_height)
-                tf = tx.text_frame; tf.clear()
-                tf.word_wrap = True
-                p1 = tf.paragraphs[0]; p1.text = "Formula:"; p1.font.bold = True
-                p2 = tf.add_paragraph(); p2.text = formula if formula else "(no formula found)"; p2.level = 1; p2.font.size = Pt(14)
-                p3 = tf.add_paragraph(); p3.text = f"Evaluated value: {format_number(info['value'], round_digits)}"; p3.level = 1; p3.font.size = Pt(14)
-                tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-                # Snippet
-                rows, cols = df_snippet.shape
-                if link_mode == "text":
-                    snip_row_height = Inches(0.4 * table_font_pt / 18)
-                    snip_height = snip_row_height * (rows + 1)
-                else:
-                    snip_height = Inches(0.6 + 0.3*max(rows,1))
-                    snip_row_height = None
-                snip_top = formula_top + formula_height + Inches(0.2)
-                s_table_shape = slide.shapes.add_table(rows+1, cols, content_left, snip_top, content_width, snip_height)
-                s_table = s_table_shape.table
-                if snip_row_height is not None:
-                    for rr in range(rows+1):
-                        s_table.rows[rr].height = int(snip_row_height)
-                for jj, hh in enumerate(df_snippet.columns):
-                    tfh = s_table.cell(0, jj).text_frame; tfh.clear()
-                    r0 = tfh.paragraphs[0].add_run(); r0.text = str(hh); r0.font.bold = True; r0.font.size = Pt(table_font_pt)
-                for ii in range(rows):
-                    for jj in range(cols):
-                        val = df_snippet.iloc[ii, jj]
-                        cell = s_table.cell(ii+1, jj)
-                        tfcell = cell.text_frame; tfcell.clear()
-                        run = tfcell.paragraphs[0].add_run()
-                        run.text = format_number(val, round_digits)
-                        run.font.size = Pt(table_font_pt)
-                detail_slide_map[(i, metric)] = slide
-
-        # write summary values
+                home_btn_tmpl = btn._element
+            else:
+                new_btn = copy.deepcopy(home_btn_tmpl)
+                new_btn.xpath('./p:spPr/a:xfrm/a:off')[0].set('x', str(int(btn_left)))
+                cNvPr = new_btn.xpath('./p:nvSpPr/p:cNvPr')[0]
+                cNvPr.set('id', str(slide.shapes._next_shape_id))
+                rId = slide.part.relate_to(summary_slide.part, RT.SLIDE)
+                cNvPr.xpath('./a:hlinkClick')[0].set(qn('r:id'), rId)
+                slide.shapes._spTree.append(new_btn)
+            # Formula box
+            formula_height = _I12
+            formula_top = title_shape.top + title_shape.height + _I02
+            tx = slide.shapes.add_textbox(content_left, formula_top, content_width, formula_height)
+            tf = tx.text_frame; tf.clear()
+            tf.word_wrap = True
+            p1 = tf.paragraphs[0]; p1.text = "Formula:"; p1.font.bold = True
+            p2 = tf.add_paragraph(); p2.text = formula if formula else "(no formula found)"; p2.level = 1; p2.font.size = _PT14
+            p3 = tf.add_paragraph(); p3.text = f"Evaluated value: {spec['value_text']}"; p3.level = 1; p3.font.size = _PT14
+            tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
+            # Snippet
+            cols = len(snippet_cols)
+            rows = len(snippet_values[0]) if snippet_values else 0
+            if link_mode == "text":
+                snip_row_height = _SNIP_ROW_H
+                snip_height = snip_row_height * (rows + 1)
+            else:
+                snip_height = Inches(0.6 + 0.3*max(rows,1))
+                snip_row_height = None
+            snip_top = formula_top + formula_height + _I02
+            s_table_shape = slide.shapes.add_table(rows+1, cols, content_left, snip_top, content_width, snip_height)
+            s_table = s_table_shape.table
+            if snip_row_height is not None:
+                snip_h = str(int(snip_row_height))
+                for tr in s_table._tbl.iter(qn('a:tr')):
+                    tr.set('h', snip_h)
+            for jj, hh in enumerate(snippet_cols):
+                _fast_set_cell_text(s_table.cell(0, jj), str(hh), sz_hundredths, bold=True)
+            # column-wise walk over the per-column arrays; each element is
+            # boxed the same way iloc boxed it, so rendering of integer and
+            # datetime cells is unchanged from the row-by-row version
+            for jj, col_vals in enumerate(snippet_values):
+                for ii, val in enumerate(col_vals):
+                    _fast_set_cell_text(s_table.cell(ii+1, jj), fmt(val), sz_hundredths)
+            detail_slide_map[spec["pos"]] = slide
+
+        # write summary values; remember which cells need overlays so the
+        # overlay pass doesn't re-walk cells or re-query detail_slide_map
+        overlay_targets = []
         for i, row in enumerate(summary, start=1):
-            tf0 = table.cell(i, 0).text_frame; tf0.clear()
-            run0 = tf0.paragraphs[0].add_run()
-            run0.text = format_number(row['key'], round_digits)
-            run0.font.size = Pt(table_font_pt)
+            _fast_set_cell_text(table.cell(i, 0), fmt(row['key']), sz_hundredths)
             for j, metric in enumerate(headers[1:], start=1):
-                tf = table.cell(i, j).text_frame; tf.clear()
-                run = tf.paragraphs[0].add_run()
-                val = row["cells"][metric]["value"]
-                text = format_number(val, round_digits)
-                run.text = text
-                run.font.size = Pt(table_font_pt)
-                if j in skip_set:
-                    continue
-                target = detail_slide_map.get((i, metric))
+                text = fmt(row["cells"][metric]["value"])
+                target = None if j in skip_set else detail_slide_map.get((i, metric))
                 if target and text != "":
+                    # a run-level hyperlink needs a materialized run, so keep
+                    # the python-pptx path for linked cells only
+                    tf = table.cell(i, j).text_frame; tf.clear()
+                    run = tf.paragraphs[0].add_run()
+                    run.text = text
+                    run.font.size = _PTF
                     tooltip = target.shapes.title.text if target.shapes.title else ""
                     link_run_to_slide(run, target, tooltip_text=tooltip)
+                    overlay_targets.append((i, j, target))
+                else:
+                    _fast_set_cell_text(table.cell(i, j), text, sz_hundredths)
 
-        # recompute actual grid
-        col_lefts = [int(left)]
-        for j in range(1, sum_cols):
-            col_lefts.append(col_lefts[-1] + int(table.columns[j-1].width))
-        row_tops = [int(top)]
-        for i in range(1, sum_rows):
-            row_tops.append(row_tops[-1] + int(table.rows[i-1].height))
+        # recompute actual grid: snapshot widths/heights in one pass each,
+        # then cumsum instead of re-querying the XML-backed proxies per cell
+        col_widths_arr = np.fromiter((int(c.width) for c in table.columns), dtype=np.int64, count=sum_cols)
+        col_lefts = (int(left) + np.concatenate(([0], np.cumsum(col_widths_arr[:-1])))).tolist()
+        row_heights_arr = np.fromiter((int(rw.height) for rw in table.rows), dtype=np.int64, count=sum_rows)
+        row_tops = (int(top) + np.concatenate(([0], np.cumsum(row_heights_arr[:-1])))).tolist()
 
         # overlays in FRONT
         if link_mode == "overlay":
-            for i in range(1, sum_rows):
-                for j, metric in enumerate(headers[1:], start=1):
-                    if j in skip_set:
-                        continue
-                    target = detail_slide_map.get((i, metric))
-                    if not target:
-                        continue
-                    cell = table.cell(i, j)
-                    txt = cell.text_frame.paragraphs[0].runs[0].text if cell.text_frame.paragraphs and cell.text_frame.paragraphs[0].runs else ""
-                    if txt == "":
-                        continue
-                    x = col_lefts[j]
-                    y = row_tops[i]
-                    w = int(table.columns[j].width)
-                    h = int(table.rows[i].height)
-                    add_overlay_link(summary_slide, x, y, w, h, target)
-
-        prs.save(out_path)
+            # Build the first rectangle the slow way (solid fill, forced
+            # transparency, no line); every further overlay is a deepcopy of
+            # its <p:sp> with only geometry, shape id and link rId rewritten.
+            tmpl_el = None
+            spTree = summary_slide.shapes._spTree
+            for i, j, target in overlay_targets:
+                x = col_lefts[j]
+                y = row_tops[i]
+                w = int(col_widths_arr[j])
+                h = int(row_heights_arr[i])
+                if tmpl_el is None:
+                    tmpl_el = add_overlay_link(summary_slide, x, y, w, h, target)._element
+                    continue
+                new_el = copy.deepcopy(tmpl_el)
+                xfrm = new_el.xpath('./p:spPr/a:xfrm')[0]
+                off = xfrm.find(qn('a:off')); off.set('x', str(x)); off.set('y', str(y))
+                ext = xfrm.find(qn('a:ext')); ext.set('cx', str(w)); ext.set('cy', str(h))
+                cNvPr = new_el.xpath('./p:nvSpPr/p:cNvPr')[0]
+                cNvPr.set('id', str(summary_slide.shapes._next_shape_id))
+                rId = summary_slide.part.relate_to(target.part, RT.SLIDE)
+                cNvPr.xpath('./a:hlinkClick')[0].set(qn('r:id'), rId)
+                spTree.append(new_el)
+
+        _save_pptx(prs, out_path)
         return out_path
     finally:
         wb_formula.close()